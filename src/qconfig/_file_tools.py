@@ -0,0 +1,123 @@
+import json
+import os
+import secrets
+import stat
+from typing import Callable, Optional
+
+import yaml  # type: ignore[import]
+
+from ._xml_tools import dict_to_element, iterparse_to_dict, write_element_to_xml_file
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as _YamlDumper  # type: ignore[import]
+    from yaml import CSafeLoader as _YamlLoader  # type: ignore[import]
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[import]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[import]
+
+
+def _slurp(filepath: str) -> bytes:
+    """Reads the raw contents of a file, the parsers decode the bytes themselves
+    so they dont have to go through a text wrapper first."""
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = []
+        while chunk := os.read(fd, 1 << 16):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def read_json(filepath: str) -> dict:
+    if orjson is None:
+        return json.loads(_slurp(filepath))
+    return orjson.loads(_slurp(filepath))
+
+
+def write_json(filepath: str, data: dict) -> None:
+    # written the same way as orjson does, so the file does not depend on the backend
+    if orjson is None:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        return
+
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def read_xml(filepath: str) -> dict:
+    return iterparse_to_dict(filepath)
+
+
+def write_xml(filepath: str, data: dict) -> None:
+    write_element_to_xml_file(dict_to_element(data), filepath)
+
+
+def read_yaml(filepath: str) -> dict:
+    return yaml.load(_slurp(filepath), Loader=_YamlLoader)
+
+
+def write_yaml(filepath: str, data: dict) -> None:
+    with open(filepath, "w") as f:
+        yaml.dump(data, f, Dumper=_YamlDumper)
+
+
+# the handlers for each supported (lowercase) file extension
+READERS: dict[str, Callable[[str], dict]] = {
+    ".json": read_json,
+    ".xml": read_xml,
+    ".yaml": read_yaml,
+    ".yml": read_yaml,
+}
+
+WRITERS: dict[str, Callable[[str, dict], None]] = {
+    ".json": write_json,
+    ".xml": write_xml,
+    ".yaml": write_yaml,
+    ".yml": write_yaml,
+}
+
+
+def read_file(filepath: str, extension: str) -> dict:
+    """Reads a file with the reader of its extension."""
+    return READERS[extension](filepath)
+
+
+def write_file(filepath: str, extension: str, data: dict) -> None:
+    """Writes the data to a file with the writer of its extension.
+
+    The data is written to a temporary file next to it first, which then
+    replaces the file. A failing write can never leave a partial file behind.
+    A symlinked file is written through the link, an existing file keeps its mode.
+    """
+    filepath = os.path.realpath(filepath)
+    try:
+        mode: Optional[int] = stat.S_IMODE(os.stat(filepath).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    directory, name = os.path.split(filepath)
+    while True:
+        tmp = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+        try:
+            # created with the usual mode, leaving it to the umask of the process
+            fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        break
+
+    try:
+        WRITERS[extension](tmp, data)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, filepath)
+    except BaseException:
+        os.remove(tmp)
+        raise
@@ -4,10 +4,10 @@ from typing import Any, Callable
 from PySide6.QtCore import SignalInstance
 from PySide6.QtWidgets import QWidget
 
-from ._method_loader import get_method
+from ._method_loader import get_methods
 
 
-@dataclass
+@dataclass(slots=True)
 class Hook:
     """A container for a hook, which provides the ability to invoke calls
     for the mapped widget such as saving or loading a value or adding a
@@ -17,6 +17,7 @@ class Hook:
     get: Callable[[], Any]
     set: Callable[[Any], None]
     callback: SignalInstance
+    widget: QWidget
 
     def __str__(self) -> str:
         return f"Hook(name={self.name}, get={self.get.__qualname__}, set={self.set.__qualname__})"
@@ -44,19 +45,15 @@ def build_hook(key: str, widget: QWidget) -> Hook:
     age_spinbox = QSpinBox()    # .objectName "age"
 
     data = {"choice": "Choice #3", "age": 18, ...}
+    widgets = {"choice": choice_combobox, "age": age_spinbox}
 
-    for k in data.keys():
-        self.hooks[k] = build_hook(k, self._get_widget([age_spinbox, choice_combobox], k))
+    for k in data:
+        self.hooks[k] = build_hook(k, widgets[k])
 
     {
         "choice": Hook(name="choice", load="<lambda>", save="<lambda>", ...),
         "age": Hook(name="age", load="<lambda>", save="<lambda>", ...),
     }
     """
-    return Hook(
-        key,
-        *(
-            get_method(widget, a)(widget)  # type: ignore[arg-type]
-            for a in ["save", "load", "callback"]
-        ),
-    )
+    save, load, callback = get_methods(widget)
+    return Hook(key, save(widget), load(widget), callback(widget), widget)
@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import Any, Callable, Literal, Type
 
 from PySide6.QtCore import QDate
@@ -9,46 +10,74 @@ from PySide6.QtWidgets import (QCheckBox, QComboBox, QDateEdit, QDoubleSpinBox,
 
 from .exceptions import UnknownWidgetError
 
+
+def _date_setter(widget: QDateEdit) -> Callable[[str], None]:
+    """Builds the setter of a `QDateEdit`, taking the date as a `dd.MM.yyyy` string.
+    The date is constructed from its components directly rather than letting Qt
+    parse a reformatted string."""
+
+    def set_date(s: str) -> None:
+        # only the exact format is accepted, same as when Qt parsed the string
+        digits = s[:2] + s[3:5] + s[6:]
+        if len(s) == 10 and s[2] == s[5] == "." and digits.isascii() and digits.isdigit():
+            date = QDate(int(s[6:]), int(s[3:5]), int(s[:2]))
+        else:
+            # an invalid date is ignored by the widget, same as a failed parse
+            date = QDate()
+        widget.setDate(date)
+
+    return set_date
+
+
 OBJECT_METHOD_MAP: dict[tuple[Type[QWidget], ...], dict[str, Callable[[Any], Any]]] = {
     (QComboBox, QFontComboBox): {
-        "save": lambda w: w.currentText,
-        "load": lambda w: w.setCurrentText,
-        "callback": lambda w: w.currentIndexChanged,
+        "save": attrgetter("currentText"),
+        "load": attrgetter("setCurrentText"),
+        "callback": attrgetter("currentIndexChanged"),
     },
     (QCheckBox,): {
-        "save": lambda w: w.isChecked,
-        "load": lambda w: w.setChecked,
-        "callback": lambda w: w.stateChanged,
+        "save": attrgetter("isChecked"),
+        "load": attrgetter("setChecked"),
+        "callback": attrgetter("stateChanged"),
     },
     (QSpinBox, QDoubleSpinBox, QSlider, QProgressBar): {
-        "save": lambda w: w.value,
-        "load": lambda w: w.setValue,
-        "callback": lambda w: w.valueChanged,
+        "save": attrgetter("value"),
+        "load": attrgetter("setValue"),
+        "callback": attrgetter("valueChanged"),
     },
     (QTextEdit, QPlainTextEdit, QTextBrowser): {
-        "save": lambda w: w.toPlainText,
-        "load": lambda w: w.setText,
-        "callback": lambda w: w.textChanged,
+        "save": attrgetter("toPlainText"),
+        "load": attrgetter("setText"),
+        "callback": attrgetter("textChanged"),
     },
     (QLineEdit,): {
-        "save": lambda w: w.text,
-        "load": lambda w: w.setText,
-        "callback": lambda w: w.textChanged,
+        "save": attrgetter("text"),
+        "load": attrgetter("setText"),
+        "callback": attrgetter("textChanged"),
     },
     (QTabWidget, QStackedWidget): {
-        "save": lambda w: w.currentIndex,
-        "load": lambda w: w.setCurrentIndex,
-        "callback": lambda w: w.currentChanged,
+        "save": attrgetter("currentIndex"),
+        "load": attrgetter("setCurrentIndex"),
+        "callback": attrgetter("currentChanged"),
     },
     (QDateEdit,): {
-        "save": lambda w: w.text,
-        "load": lambda w: lambda s: w.setDate(
-            QDate.fromString(f"{s[6:]}.{s[3:5]}.{s[:2]}", "yyyy.MM.dd")
-        ),
-        "callback": lambda w: w.dateChanged,
+        "save": attrgetter("text"),
+        "load": _date_setter,
+        "callback": attrgetter("dateChanged"),
     },
 }
 
+# the position of each actions method in the dispatched method tuples
+_ACTIONS: dict[str, int] = {"save": 0, "load": 1, "callback": 2}
+
+_Methods = tuple[Callable[[Any], Any], Callable[[Any], Any], Callable[[Any], Any]]
+
+_DISPATCH: dict[Type[QWidget], _Methods] = {
+    cls: (methods["save"], methods["load"], methods["callback"])
+    for classes, methods in OBJECT_METHOD_MAP.items()
+    for cls in classes
+}
+
 
 def get_method(
     widget: QWidget, action: Literal["save", "load", "callback"]
@@ -71,22 +100,39 @@ def get_method(
     Raises
     ------
     `ValueError`
-        When the widget is not of type `QWidget`, or the action is invalid
+        When the action is invalid
 
     `UnknownWidgetError`
         When the widget could not be found, note that this does not mean it's
-        not an existing widget, but rather that it is unsupported
+        not an existing widget, but rather that it is unsupported. Objects that
+        are not a `QWidget` are never found either
     """
-    if not isinstance(widget, QWidget):
-        raise ValueError(
-            f"Invalid widget type. Expected QWidget, got {type(widget).__name__}"
-        )
-
-    if action not in ["save", "load", "callback"]:
+    index = _ACTIONS.get(action)
+    if index is None:
         raise ValueError(widget, action)
+    return get_methods(widget)[index]
+
 
-    for k, v in OBJECT_METHOD_MAP.items():
-        if type(widget) in k:
-            return v[action]
+def get_methods(widget: QWidget) -> _Methods:
+    """Gets all methods of a widget at once.
 
-    raise UnknownWidgetError(widget)
+    Parameters
+    ----------
+    widget :class:`QWidget`:
+        The widget to find the methods of
+
+    Returns
+    -------
+    `tuple[Callable, Callable, Callable]`
+        The `save`, `load` and `callback` methods for the widget, in that order
+
+    Raises
+    ------
+    `UnknownWidgetError`
+        When the widget could not be found, note that this does not mean it's
+        not an existing widget, but rather that it is unsupported
+    """
+    methods = _DISPATCH.get(type(widget))
+    if methods is None:
+        raise UnknownWidgetError(widget)
+    return methods
@@ -1,18 +1,12 @@
-import xml.dom.minidom
 import xml.etree.ElementTree as ET
 from collections import defaultdict
 
 
-def write_to_xml_file(data: bytes, filepath: str) -> None:
-    # Decode the bytes literal to a string
-    xml_string = data.decode()
-
-    # Use the xml.dom.minidom module to format the XML string
-    xml_data = xml.dom.minidom.parseString(xml_string)
-    pretty_xml_str = xml_data.toprettyxml()
-
-    with open(filepath, "w") as f:
-        f.write(pretty_xml_str)
+def write_element_to_xml_file(root: ET.Element, filepath: str) -> None:
+    # indent in place and write the tree straight to the file
+    # without building a formatted copy first
+    ET.indent(root, space="\t")
+    ET.ElementTree(root).write(filepath, encoding="utf-8", xml_declaration=True)
 
 
 def etree_to_dict(t):
@@ -28,40 +22,83 @@ def etree_to_dict(t):
     `dict`:
         A dictionary representation of the element tree
     """
-    d = {t.tag: {} if t.attrib else None}
-    children = list(t)
-    if children:
-        dd = defaultdict(list)
-        for dc in map(etree_to_dict, children):
-            for k, v in dc.items():
-                dd[k].append(v)
-        d = {t.tag: {k:v[0] if len(v) == 1 else v for k, v in dd.items()}}
+    # walk the tree with an explicit stack rather than recursing, each entry
+    # holds an element, the iterator over its children and its converted children
+    stack = [(t, iter(t), defaultdict(list))]
+    while True:
+        elem, children, dd = stack[-1]
+        child = next(children, None)
+        if child is not None:
+            stack.append((child, iter(child), defaultdict(list)))
+            continue
+
+        stack.pop()
+        value = _element_value(elem, dd)
+        if not stack:
+            return {elem.tag: value}
+        stack[-1][2][elem.tag].append(value)
+
+
+def iterparse_to_dict(source):
+    """Parses a XML file straight into a dictionary, producing the same result
+    as `etree_to_dict` on the parsed root without keeping the whole element
+    tree in memory.
+
+    Parameters
+    ---------
+    source :class:`str`:
+        The path or file object of the XML document
+
+    Returns
+    -------
+    `dict`:
+        A dictionary representation of the document
+    """
+    stack = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(defaultdict(list))
+            continue
+
+        value = _element_value(elem, stack.pop())
+        # the element is fully converted, release its text, attributes and children
+        elem.clear()
+        if not stack:
+            return {elem.tag: value}
+        stack[-1][elem.tag].append(value)
+
+
+def _element_value(t, dd):
+    """Builds the value of an element from its attributes, text and
+    the already converted values of its children, grouped by tag."""
+    if dd:
+        d = {k: v[0] if len(v) == 1 else v for k, v in dd.items()}
+    else:
+        d = {} if t.attrib else None
     if t.attrib:
-        d[t.tag].update(('@' + k, v) for k, v in t.attrib.items())
+        d.update(('@' + k, v) for k, v in t.attrib.items())
     if t.text:
         text = t.text.strip()
-        if children or t.attrib:
+        if dd or t.attrib:
             if text:
-              d[t.tag]['#text'] = text
+                d['#text'] = text
         else:
-            d[t.tag] = text
+            d = text
     return d
-    
-def dict_to_etree(d):
-    """Convert a dictionary to an xml.etree.ElementTree object.
-    
+
+
+def dict_to_element(d):
+    """Convert a dictionary to an xml.etree.ElementTree element.
+
     Parameters
     ----------
     data :class:`dict`:
         The dictionary to conver to a xml element tree
 
-    parent :class:`ElementTree.Element`:
-        The current parent of the element tree
-
     Returns
     -------
-    `ElementTree`:
-        The dictionary represented as an element tree
+    `ElementTree.Element`:
+        The root element of the dictionary represented as an element tree
     """
     def _to_etree(d, root):
         if not d:
@@ -88,4 +125,4 @@ def dict_to_etree(d):
     tag, body = next(iter(d.items()))
     node = ET.Element(tag)
     _to_etree(body, node)
-    return ET.tostring(node)
\ No newline at end of file
+    return node
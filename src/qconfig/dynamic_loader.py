@@ -1,11 +1,14 @@
 import difflib
 import json
 from dataclasses import dataclass, field
+from typing import Iterable, Optional
 
 from PySide6.QtWidgets import QWidget
 
 from .exceptions import WidgetNotFoundError
 
+_COMPLEMENT_CUTOFF = 0.43
+
 
 @dataclass
 class QConfigDynamicLoader:
@@ -34,13 +37,14 @@ class QConfigDynamicLoader:
     complement_keys: bool = field(kw_only=True, default=False)
     show_build: bool = field(kw_only=True, default=False)
 
-    def build(self, widgets: list[QWidget]) -> None:
+    def build(self, widgets: list[QWidget] | dict[str, QWidget]) -> None:
         """Builds the loader with a list of available widgets.
 
         Parameters
         ----------
-        widgets :class:`QWidget`:
-            A list of widgets available in the UI
+        widgets :class:`list[QWidget] | dict[str, QWidget]`:
+            A list of widgets available in the UI, or the widgets already
+            mapped by their object name
 
         Raises
         ------
@@ -50,7 +54,11 @@ class QConfigDynamicLoader:
         `InvalidWidgetMappingError`
             When the widget to a key could not be found
         """
-        widget_names = [w.objectName() for w in widgets]
+        if isinstance(widgets, dict):
+            self._name_to_widget = dict(widgets)
+        else:
+            self._name_to_widget = {w.objectName(): w for w in widgets}
+        widget_names = set(self._name_to_widget)
         if isinstance(self.data, dict):
             self._print_build("Building dynamic loader from dict...")
             self._validate_key_presence(widget_names)
@@ -62,7 +70,30 @@ class QConfigDynamicLoader:
             f"Building successful!\n{json.dumps(self.built_data, indent=4)}"
         )
 
-    def _validate_key_presence(self, widgets: list[str]) -> None:
+    def widget_for(self, key: str) -> QWidget:
+        """Gets the widget a key was mapped to when the loader was built.
+
+        Parameters
+        ----------
+        key :class:`str`:
+            The key to get the widget of
+
+        Returns
+        -------
+        `QWidget`:
+            The widget the key is mapped to
+
+        Raises
+        ------
+        `WidgetNotFoundError`
+            When the key is not mapped, or its widget was not passed to `build`
+        """
+        try:
+            return self._name_to_widget[self.built_data[key]]
+        except KeyError:
+            raise WidgetNotFoundError(key) from None
+
+    def _validate_key_presence(self, widgets: set[str]) -> None:
         """Helper method to validate that all values in the data are existing
         widgets. When a widget is missing, if the complement flag is `True`
         we try to find the widget and add it."""
@@ -82,21 +113,33 @@ class QConfigDynamicLoader:
 
         self.built_data = self.data
 
-    def _build_from_list(self, widgets: list[str]) -> None:
+    def _build_from_list(self, widgets: set[str]) -> None:
         """Helper method to build the data from the list of keys,
         when no exact key for a match was found, use difflib to determine
         the closest machtching widget object name for the missing key."""
         if not isinstance(self.data, list):
             raise ValueError(f"Invalid data type. Expected list, got {type(self.data)}")
 
-        matches = {k: k for k in self.data if k in widgets}
+        matches: dict[str, str] = {}
+        remaining_keys: list[str] = []
+        for k in self.data:
+            if k in widgets:
+                matches[k] = k
+            else:
+                remaining_keys.append(k)
         self._print_build(f"Perfect matches: {matches}. Complementing remainders...")
 
-        remaining_keys = [k for k in self.data if k not in matches.keys()]
-        remaining_widgets = [k for k in widgets if k not in matches.keys()]
+        # only set up the matching when there is something to complement,
+        # all remaining keys share the candidate widgets and the matcher
+        matcher = None
+        if self.complement_keys and remaining_keys:
+            remaining_widgets = widgets.difference(matches)
+            matcher = difflib.SequenceMatcher()
 
         for k in remaining_keys:
-            if self.complement_keys and self._complement(matches, k, remaining_widgets):
+            if matcher is not None and self._complement(
+                matches, k, remaining_widgets, matcher
+            ):
                 self._print_build(f"Complemented '{k}'.")
                 continue
 
@@ -108,7 +151,12 @@ class QConfigDynamicLoader:
         self.built_data = matches
 
     @staticmethod
-    def _complement(data: dict, key: str, widgets: list[str]) -> bool:
+    def _complement(
+        data: dict,
+        key: str,
+        widgets: Iterable[str],
+        matcher: Optional[difflib.SequenceMatcher] = None,
+    ) -> bool:
         """Adds a key to a dataset if a close match to the key is found in
         the list of widges. If no match was found it simple does nothing.
 
@@ -120,18 +168,40 @@ class QConfigDynamicLoader:
         key :class:`str`:
             The key to complement
 
-        widgets :class:`Str`:
-            A list of possibly matching widgets
+        widgets :class:`Iterable[str]`:
+            The possibly matching widgets
+
+        matcher :class:`difflib.SequenceMatcher` [Optional]:
+            A matcher to reuse across several keys, if None is passed
+            a new one is created
 
         Returns
         -------
         `bool`
             Whether the key was complemented or not
         """
-        matches = difflib.get_close_matches(key, widgets, n=1, cutoff=0.43)
-        if matches:
-            data[key] = matches[0]
-        return bool(matches)
+        # same scoring as `difflib.get_close_matches(key, widgets, n=1)` but
+        # without the per call matcher, result list and heap
+        if matcher is None:
+            matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(key)
+
+        best: Optional[tuple[float, str]] = None
+        for widget in widgets:
+            matcher.set_seq1(widget)
+            if (
+                matcher.real_quick_ratio() < _COMPLEMENT_CUTOFF
+                or matcher.quick_ratio() < _COMPLEMENT_CUTOFF
+            ):
+                continue
+
+            score = matcher.ratio()
+            if score >= _COMPLEMENT_CUTOFF and (best is None or (score, widget) > best):
+                best = (score, widget)
+
+        if best is not None:
+            data[key] = best[1]
+        return best is not None
 
     def _print_build(self, message: str) -> None:
         """Print wrapper to print only when the `show_build` flag is `True`.
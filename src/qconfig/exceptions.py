@@ -44,7 +44,7 @@ class WidgetError(Exception):
     """Parent exceptions for all errors related to widgets"""
 
 
-class UnknownWidgetError(LookupError):
+class UnknownWidgetError(WidgetError, LookupError):
     """Raised when the method for a widget could not be found"""
 
     def __init__(self, widget: QWidget) -> None:
@@ -54,7 +54,7 @@ class UnknownWidgetError(LookupError):
         return f"Not yet supported widget: {type(self.widget).__name__}"
 
 
-class WidgetNotFoundError(LookupError):
+class WidgetNotFoundError(WidgetError, LookupError):
     """Raised when a widget could not be found"""
 
     def __init__(self, key: str) -> None:
@@ -64,7 +64,7 @@ class WidgetNotFoundError(LookupError):
         return f"Missing widget for '{self.key}'"
 
 
-class InvalidWidgetError(ValueError):
+class InvalidWidgetError(WidgetError, ValueError):
     """Raised when a widget is of a wrong type"""
 
     def __init__(self, widget: QWidget) -> None:
@@ -74,7 +74,7 @@ class InvalidWidgetError(ValueError):
         return f"Invalid widget: {type(self.widget).__name__}"
 
 
-class InvalidWidgetArgumentError(ValueError):
+class InvalidWidgetArgumentError(WidgetError, ValueError):
     """Raised when the argument to a widget is of a wrong type"""
 
     def __init__(self, widget: QWidget, argument: Any) -> None:
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import json
 import os
-import xml.etree.ElementTree as ET
-from typing import Any, Callable, Optional
+import threading
+import weakref
+from typing import Any, Callable, Iterator, Optional
 
-import yaml  # type: ignore[import]
+import shiboken6
+from PySide6.QtCore import QObject, QTimer, Signal
 from PySide6.QtWidgets import QWidget
 
+from ._file_tools import READERS, WRITERS, read_file, write_file
 from ._hook import Hook, build_hook
-from ._xml_tools import dict_to_etree, etree_to_dict, write_to_xml_file
 from .dynamic_loader import QConfigDynamicLoader
 from .exceptions import (
     HookNotFoundError,
@@ -17,6 +18,23 @@ from .exceptions import (
     WidgetNotFoundError,
 )
 
+# the names of the configs hooking each widget name, keyed by the id of the
+# config so that its widgets are released without touching those of others
+_WIDGET_OWNERS: dict[str, dict[int, str]] = {}
+# reentrant, the garbage collector may release the widgets of a config from
+# `__del__` while the same thread is still holding the lock
+_WIDGET_OWNERS_LOCK = threading.RLock()
+
+# a hooked value in the data: the dict holding it, its key and its hook's getter
+# and setter
+_Leaf = tuple[dict, str, Callable[[], Any], Callable[[Any], None]]
+
+
+class _ChangeRelay(QObject):
+    """Forwards the change signal of every hook of a config as one signal."""
+
+    changed = Signal()
+
 
 class QConfig:
     """QConfig Data Container
@@ -34,8 +52,9 @@ class QConfig:
     name :class:`str`:
         The name of the qconfig container
 
-    widgets :class:`list[QWidget]`:
-        The list of QWidgets in the ui
+    widgets :class:`list[QWidget] | dict[str, QWidget]`:
+        The list of QWidgets in the ui, or the QWidgets mapped by their object
+        name, see `tools.get_all_widgets_map`
 
     data :class:`dict` [Optional]:
         The dataset the qconfig class needs to handle
@@ -55,6 +74,10 @@ class QConfig:
     dump_on_save :class:`bool`:
         Whether to write to the file after `get_data` is called. Filepath required.
 
+    dump_delay :class:`int`:
+        Milliseconds to wait for further changes before dumping on save, so that
+        bursts of changes are written once. `0` writes right away.
+
     dump_on_save :class:`bool`:
         Whether to print building information to the console
 
@@ -83,12 +106,10 @@ class QConfig:
     ```
     """
 
-    _hooked_widgets: dict[str, list[str]] = {}
-
     def __init__(
         self,
         name: str,
-        widgets: list[QWidget],
+        widgets: list[QWidget] | dict[str, QWidget],
         data: Optional[dict] = None,
         filepath: Optional[str] = None,
         loader: Optional[QConfigDynamicLoader] = None,
@@ -98,12 +119,14 @@ class QConfig:
         allow_multiple_hooks: bool = False,
         save_on_change: bool = False,
         dump_on_save: bool = False,
+        dump_delay: int = 0,
         show_build: bool = False,
     ) -> None:
         self._name = name
         self._recursive = recursive
         self._save_on_change = save_on_change
         self._dump_on_save = dump_on_save
+        self._dump_delay = dump_delay
         self._show_build = show_build
         self._suppress = suppress or []
 
@@ -111,6 +134,14 @@ class QConfig:
         self.allow_mutliple_hooks = allow_multiple_hooks
         self._ignore_changes = False
         self._hooks: dict[str, Hook] = {}
+        self._hook_by_widget_name: dict[str, Hook] = {}
+        self._hooked_widgets: set[str] = set()
+        self._callback_wrappers: dict[Callable, Callable] = {}
+        self._connected: dict[Callable, set[str]] = {}
+        self._change_relay: Optional[_ChangeRelay] = None
+        self._save_wrapper = self._wrap_callback(self.get_data)
+        self._dump_timer: Optional[QTimer] = None
+        self._dumped: Optional[tuple[tuple[str, Any], ...]] = None
 
         if data is None and filepath is None:
             raise ValueError("Either `data` or `filepath` must be provided.")
@@ -130,7 +161,7 @@ class QConfig:
             self._build_widget_hooks_from_loader(self.data, widgets, loader)
 
         if save_on_change:
-            self.connect_callback(self.get_data)
+            self._connect_save_on_change()
 
     def __str__(self) -> str:
         return f"QConfig '{self._name}', responsible for {list(self.data.keys())}"
@@ -139,8 +170,13 @@ class QConfig:
         return f"QConfig(name={self._name}, data={self.data}, filepath={self.filepath})"
 
     def __del__(self) -> None:
-        """Make sure we 'unhook' the widget when the QConfig gets garbage collected."""
-        self.destroy()
+        """Make sure we 'unhook' the widget when the QConfig gets garbage collected.
+
+        Nothing is written and no Qt objects are touched here, they may already
+        be deleted while the interpreter exits. Call `destroy` to flush pending
+        changes and disconnect the callbacks.
+        """
+        self._release_hooked_widgets()
 
     @property
     def name(self) -> str:
@@ -153,6 +189,16 @@ class QConfig:
             for k, h in self._hooks.items()
         )
 
+    @property
+    def filepath(self) -> Optional[str]:
+        return self._filepath
+
+    @filepath.setter
+    def filepath(self, filepath: Optional[str]) -> None:
+        self._filepath = filepath
+        # normalized once, so `read` and `write` only need to look up the handler
+        self._ext = os.path.splitext(filepath or "")[1].lower()
+
     @property
     def save_on_change(self) -> bool:
         return self._save_on_change
@@ -162,9 +208,9 @@ class QConfig:
         if state == self._save_on_change:
             return
         if state:
-            self.connect_callback(self.get_data)
+            self._connect_save_on_change()
         else:
-            self.disconnect_callback(self.get_data)
+            self._disconnect_save_on_change()
         self._save_on_change = state
 
     @property
@@ -177,9 +223,27 @@ class QConfig:
             raise ValueError("Can't dump on save without provided filepath!")
         self._dump_on_save = state
 
+    @property
+    def dump_delay(self) -> int:
+        return self._dump_delay
+
+    @dump_delay.setter
+    def dump_delay(self, delay: int) -> None:
+        self._dump_delay = delay
+        if self._dump_timer is not None:
+            self._dump_timer.setInterval(delay)
+
     def destroy(self) -> None:
+        self.flush()
+        self.save_on_change = False
         self.disconnect_callback()
-        self._hooked_widgets.pop(self._name, None)
+        self._release_hooked_widgets()
+
+        # the timer and relay are deleted now rather than whenever they are collected
+        if self._dump_timer is not None:
+            self._dump_timer.stop()
+            self._dump_timer = None
+        self._change_relay = None
         del self
 
     def read(self) -> None:
@@ -199,22 +263,10 @@ class QConfig:
         if self.filepath is None:
             raise ValueError("Can't read from file because no filepath is provided.")
 
-        _, extension = os.path.splitext(self.filepath)
-
-        if extension == ".json":
-            with open(self.filepath, "r") as f:
-                self.data = json.load(f)
-
-        elif extension == ".xml":
-            tree = ET.parse(self.filepath)
-            root = tree.getroot()
-            self.data = etree_to_dict(root)
-
-        elif extension in [".yaml", ".yml"]:
-            with open(self.filepath, "r") as f:
-                self.data = yaml.safe_load(f)
-        else:
-            raise ValueError(f"Unsupported file format: {extension}")
+        if self._ext not in READERS:
+            raise ValueError(f"Unsupported file format: {self._ext}")
+        self.data = read_file(self.filepath, self._ext)
+        self._dumped = self._snapshot()
 
     def write(self) -> None:
         """Writes the data to the file provided as `filepath`.
@@ -230,18 +282,17 @@ class QConfig:
         if self.filepath is None:
             raise ValueError("Can't read from file because no filepath is provided.")
 
-        _, extension = os.path.splitext(self.filepath)
-        if extension == ".json":
-            with open(self.filepath, "w") as f:
-                json.dump(self.data, f, indent=4)
-
-        elif extension == ".xml":
-            data = dict_to_etree(self.data)
-            write_to_xml_file(data, self.filepath)
+        if self._ext not in WRITERS:
+            raise ValueError(f"Unsupported file format: {self._ext}")
+        write_file(self.filepath, self._ext, self.data)
+        self._dumped = self._snapshot()
 
-        elif extension in [".yaml", ".yml"]:
-            with open(self.filepath, "w") as f:
-                yaml.dump(self.data, f)
+    def flush(self) -> None:
+        """Writes the changes still waiting for the `dump_delay` to pass right
+        away, e.g. before the application is closed."""
+        if self._dump_timer is not None and self._dump_timer.isActive():
+            self._dump_timer.stop()
+            self._write_changes()
 
     def set_data(self, data: Optional[dict] = None) -> None:
         """Iterates over all items in the date and finds the corresponding widget,
@@ -258,26 +309,15 @@ class QConfig:
         `LookupError`
             When the widget for a key in the date is missing
         """
-        master = data is None
-        if master:
-            data = self.data
+        if data is None:
             self._ignore_changes = True
-
-        assert data is not None
-
-        for k, v in data.items():
-            if isinstance(v, dict):
-                self.set_data(v)
-                continue
-
-            if k in self._suppress:
-                continue
-
-            hook = self._hooks[k]
-            hook.set(v)
-
-        if master:
+            for d, k, _, set_value in self._get_leaves():
+                set_value(d[k])
             self._ignore_changes = False
+            return
+
+        for d, k in self._walk_leaves(data):
+            self._hooks[k].set(d[k])
 
     def get_data(self, data: Optional[dict] = None) -> None:
         """Iterates over all items in the date and finds the corresponding widget,
@@ -296,24 +336,17 @@ class QConfig:
         """
         if self._ignore_changes:
             return
-        
-        master_call = data is None
-        if data is None:
-            data = self.data
-
-        for k, v in data.items():
-            if isinstance(v, dict):
-                self.get_data(v)
-                continue
 
-            if k in self._suppress:
-                continue
+        if data is None:
+            for d, k, get_value, _ in self._get_leaves():
+                d[k] = get_value()
 
-            hook = self._hooks[k]
-            data[k] = hook.get()
+            if self._dump_on_save:
+                self._dump()
+            return
 
-        if master_call and self._dump_on_save:
-            self.write()
+        for d, k in self._walk_leaves(data):
+            d[k] = self._hooks[k].get()
 
     def connect_callback(
         self, callback: Callable, exclude: Optional[list[str]] = None
@@ -328,11 +361,19 @@ class QConfig:
         exclude :class:`list[str]`:
             A list of keys not to add the callback to
         """
+        key = self._callback_key(callback)
+        wrapper = self._callback_wrappers.get(key)
+        if wrapper is None:
+            wrapper = self._callback_wrappers[key] = self._wrap_callback(callback)
+        connected = self._connected.setdefault(key, set())
+        excluded = frozenset(exclude or ())
+
         for k, hook in self._hooks.items():
-            if exclude is not None and k in exclude:
+            if k in connected or k in excluded:
                 continue
 
-            hook.callback.connect(lambda: callback())
+            hook.callback.connect(wrapper)
+            connected.add(k)
 
     def disconnect_callback(
         self, callback: Optional[Callable] = None, exclude: Optional[list[str]] = None
@@ -348,26 +389,149 @@ class QConfig:
         exclude :class:`list[str]` [Optional]:
             A list of keys not to add the callback to
         """
-        for k, hook in self._hooks.items():
-            if exclude is not None and k in exclude:
+        if callback is None:
+            keys = list(self._connected)
+        else:
+            keys = [self._callback_key(callback)]
+        excluded = frozenset(exclude or ())
+
+        for cb in keys:
+            connected = self._connected.get(cb)
+            if not connected:
+                self._print_build(f"Tried disconnecting non connected signal '{cb}'")
                 continue
-            try:
-                hook.callback.disconnect(callback)
-            except RuntimeError:
-                print(f"Tried disconnecting non connected signal '{callback}'")
+
+            wrapper = self._callback_wrappers[cb]
+            for k in connected - excluded:
+                # the signals of deleted widgets are already disconnected by Qt
+                hook = self._hooks[k]
+                if shiboken6.isValid(hook.widget):
+                    hook.callback.disconnect(wrapper)
+                connected.discard(k)
+
+            # the wrapper is still needed while any hook remains connected
+            if not connected:
+                del self._connected[cb]
+                del self._callback_wrappers[cb]
+
+    def _dump(self) -> None:
+        """Writes the data after `get_data`, when a `dump_delay` is set the write
+        waits until no further changes happened during the delay."""
+        if self._dump_delay <= 0:
+            self._write_changes()
+            return
+
+        if self._dump_timer is None:
+            self._dump_timer = QTimer()
+            self._dump_timer.setSingleShot(True)
+            self._dump_timer.setInterval(self._dump_delay)
+            self._dump_timer.timeout.connect(self._wrap_callback(self._write_changes))
+        self._dump_timer.start()
+
+    def _write_changes(self) -> None:
+        """Writes the data unless it is still the same as when the file was last
+        read or written, e.g. when a change was reverted before the dump."""
+        if self._snapshot() != self._dumped:
+            self.write()
+
+    def _snapshot(self) -> tuple[tuple[str, Any], ...]:
+        """Gets the `(key, value)` of every hooked value in the data, in the order
+        they are walked. The hooked values are the only values `get_data` changes,
+        so comparing the snapshots tells whether a dump would change the file,
+        without keeping a copy of the whole data.
+        """
+        return tuple((k, d[k]) for d, k in self._walk_leaves(self.data))
+
+    def _connect_save_on_change(self) -> None:
+        """Connects `get_data` to the relayed change signal of the hooks.
+
+        The hooks are only connected to the relay the first time, so toggling
+        `save_on_change` afterwards is a single (dis)connect of the relay.
+        """
+        if self._change_relay is None:
+            self._change_relay = _ChangeRelay()
+            for hook in self._hooks.values():
+                hook.callback.connect(self._change_relay.changed)
+        self._change_relay.changed.connect(self._save_wrapper)
+
+    def _disconnect_save_on_change(self) -> None:
+        """Disconnects `get_data` from the relayed change signal of the hooks."""
+        # the relay may already be deleted by Qt, e.g. while the interpreter exits
+        if self._change_relay is not None and shiboken6.isValid(self._change_relay):
+            self._change_relay.changed.disconnect(self._save_wrapper)
+
+    def _callback_key(self, callback: Callable) -> Callable:
+        """Gets the key the wrapper of a callback is stored under. Methods bound
+        to this instance are stored by their function, so that the instance
+        does not reference itself through its wrappers."""
+        if getattr(callback, "__self__", None) is self:
+            return callback.__func__  # type: ignore[attr-defined]
+        return callback
+
+    def _wrap_callback(self, callback: Callable) -> Callable:
+        """Wraps a callback to be connected to the signals of the hooks.
+
+        The signals pass their new value, which the callbacks don't accept, so
+        it is dropped once here rather than wrapping the callback per hook. The
+        same wrapper is then known when the callback is disconnected again.
+
+        Methods bound to this instance only hold a weak reference to it, else the
+        connected signals would keep it alive for as long as the widgets exist.
+        """
+        if getattr(callback, "__self__", None) is not self:
+            return lambda *_: callback()
+
+        func = callback.__func__  # type: ignore[attr-defined]
+        ref = weakref.ref(self)
+
+        def wrapper(*_: Any) -> None:
+            instance = ref()
+            if instance is not None:
+                func(instance)
+
+        return wrapper
 
     def values_match(self) -> bool:
         """Returns whether all values in the widgets match their value in
         the hooked dataset."""
-        return all(hook.get() == self.data[k] for k, hook in self._hooks.items())
+        for d, k, get_value, _ in self._get_leaves():
+            if get_value() != d[k]:
+                return False
+        return True
 
     def get_widget_value(self, widget_name: str) -> Any:
         """Gets the value of a hooked widget by name. Raises `HookNotFoundError`
         if no `Hook` is bound to the widget."""
-        for hook in self._hooks.values():
-            if hook.name == widget_name:
-                return hook.get()
-        raise HookNotFoundError(widget_name)
+        hook = self._hook_by_widget_name.get(widget_name)
+        if hook is None:
+            raise HookNotFoundError(widget_name)
+        return hook.get()
+
+    def _get_leaves(self) -> Iterator[_Leaf]:
+        """Walks the instance data for the `(dict, key, get, set)` of every hooked
+        value. The data is walked again on every call, since its sub dicts may
+        be replaced at any time.
+        """
+        hooks = self._hooks
+        for d, k in self._walk_leaves(self.data):
+            hook = hooks[k]
+            yield d, k, hook.get, hook.set
+
+    def _walk_leaves(self, data: dict) -> Iterator[tuple[dict, str]]:
+        """Walks a dataset and its sub dicts, yielding the `(dict, key)` of every
+        value that is not suppressed. The sub dicts are walked with a stack
+        rather than recursively, the values of a dict come before its sub dicts.
+        """
+        stack = [data]
+        while stack:
+            d = stack.pop()
+            for k, v in d.items():
+                if isinstance(v, dict):
+                    stack.append(v)
+                    continue
+
+                if k not in self._suppress:
+                    yield d, k
 
     def _check_widget_not_hooked(self, widget_name: str) -> None:
         """Checks whether a widget is already hooked in another QConfig.
@@ -382,12 +546,46 @@ class QConfig:
         `WidgetAlreadydHookedError`
             If the widget is already hooked
         """
-        for name, widgets in self._hooked_widgets.items():
-            if widget_name in widgets:
-                raise WidgetAlreadydHookedError(widget_name, name)
+        # a config with the same name takes over the widgets of the previous one
+        with _WIDGET_OWNERS_LOCK:
+            for owner in _WIDGET_OWNERS.get(widget_name, {}).values():
+                if owner != self._name:
+                    raise WidgetAlreadydHookedError(widget_name, owner)
         self._print_build(f"Widget '{widget_name}' is not hooked...")
 
-    def _build_widget_hooks(self, data: dict, widgets: list[QWidget]) -> None:
+    def _release_hooked_widgets(self) -> None:
+        """Removes this QConfig from the owners of the widgets it hooked."""
+        with _WIDGET_OWNERS_LOCK:
+            for widget_name in self._hooked_widgets:
+                owners = _WIDGET_OWNERS.get(widget_name)
+                if owners is None:
+                    continue
+                owners.pop(id(self), None)
+                if not owners:
+                    del _WIDGET_OWNERS[widget_name]
+        self._hooked_widgets = set()
+
+    def _mark_hooked(self, widget_name: str, hook: Hook) -> None:
+        """Registers a widget as hooked by this QConfig and indexes its hook.
+
+        Unless multiple hooks are allowed, the widget is checked not to be hooked
+        in another QConfig in the same step, so two configs can't both claim it.
+
+        Raises
+        -------
+        `WidgetAlreadydHookedError`
+            If the widget is already hooked
+        """
+        with _WIDGET_OWNERS_LOCK:
+            if not self.allow_mutliple_hooks:
+                self._check_widget_not_hooked(widget_name)
+            _WIDGET_OWNERS.setdefault(widget_name, {})[id(self)] = self._name
+        self._hooked_widgets.add(widget_name)
+        self._hook_by_widget_name.setdefault(widget_name, hook)
+
+    def _build_widget_hooks(
+        self, data: dict, widgets: list[QWidget] | dict[str, QWidget]
+    ) -> None:
         """Builds the hooks from each key in the data to the widget.
 
         Parameters
@@ -395,38 +593,42 @@ class QConfig:
         data :class:`dict`:
             The dictionary containing the values to hook
 
-        widgets :class:`list[QWidget]`:
-            A list of possibly matching widgets
+        widgets :class:`list[QWidget] | dict[str, QWidget]`:
+            The possibly matching widgets, or the widgets mapped by their name
 
         Raises
         ------
         `WidgetNotFoundError`
             When the widget wasnt found
         """
-        self._hooked_widgets[self._name] = []
-        widget_names = [w.objectName() for w in widgets]
-        for k, v in data.items():
-            if self._recursive and isinstance(v, dict):
-                self._print_build(f"Found subdict '{k}', hooking recursively...")
-                self._build_widget_hooks(v, widgets)
-                continue
-
-            if k not in widget_names:
-                if k in self._suppress:
+        widget_map = self._map_widgets(widgets)
+        self._release_hooked_widgets()
+
+        # sub dicts are hooked from a stack rather than recursively
+        stack = [data]
+        while stack:
+            for k, v in stack.pop().items():
+                if self._recursive and isinstance(v, dict):
+                    self._print_build(f"Found subdict '{k}', hooking recursively...")
+                    stack.append(v)
                     continue
-                raise WidgetNotFoundError(k)
-
-            if not self.allow_mutliple_hooks:
-                self._check_widget_not_hooked(k)
 
-            self._print_build(f"Building hook for '{k}'...")
-            self._hooks[k] = build_hook(k, self._get_widget(widgets, k))
-            self._hooked_widgets[self._name].append(k)
-            self._print_build(f"Successfully hooked '{k}'! {self._hooks[k]}")
+                widget = widget_map.get(k)
+                if widget is None:
+                    if k in self._suppress:
+                        continue
+                    raise WidgetNotFoundError(k)
 
+                self._print_build(f"Building hook for '{k}'...")
+                self._hooks[k] = build_hook(k, widget)
+                self._mark_hooked(k, self._hooks[k])
+                self._print_build(f"Successfully hooked '{k}'! {self._hooks[k]}")
 
     def _build_widget_hooks_from_loader(
-        self, data: dict, widgets: list[QWidget], loader: QConfigDynamicLoader
+        self,
+        data: dict,
+        widgets: list[QWidget] | dict[str, QWidget],
+        loader: QConfigDynamicLoader,
     ) -> None:
         """Builds the hooks using a dynamic loader, which means when it cant
         find a matching widget from the config key, it will look in the loader
@@ -437,8 +639,8 @@ class QConfig:
         data :class:`dict`:
             The dictionary containing the values to hook
 
-        widgets :class:`list[QWidget]`:
-            A list of possibly matching widgets
+        widgets :class:`list[QWidget] | dict[str, QWidget]`:
+            The possibly matching widgets, or the widgets mapped by their name
 
         loader :class:`QConfigDynamicLoader`:
             The loader to build to hook non matching key-widget pairs
@@ -463,57 +665,43 @@ class QConfig:
         """
         # build the loader with the widgets
         self._print_build(f"Building dynamic loader...")
-        loader.build(widgets)
-        self._hooked_widgets[self._name] = []
-        widget_names = [w.objectName() for w in widgets]
-
-        for k, v in data.items():
-            if not self.allow_mutliple_hooks:
-                self._check_widget_not_hooked(k)
-
-            if self._recursive and isinstance(v, dict):
-                self._print_build(f"Found subdict '{k}', hooking recursively...")
-                self._build_widget_hooks_from_loader(v, widgets, loader)
-                continue
+        widget_map = self._map_widgets(widgets)
+        loader.build(widget_map)
+        self._release_hooked_widgets()
+
+        # sub dicts are hooked from a stack rather than recursively
+        stack = [data]
+        while stack:
+            for k, v in stack.pop().items():
+                if not self.allow_mutliple_hooks:
+                    self._check_widget_not_hooked(k)
+
+                if self._recursive and isinstance(v, dict):
+                    self._print_build(f"Found subdict '{k}', hooking recursively...")
+                    stack.append(v)
+                    continue
 
-            # check if k matches or if k is in the dynamic loader
-            # if k is in neither of them then we are missing a widget
-            origin_k = k
-            if k not in widget_names:
-                if k not in loader.built_data.keys():
-                    raise WidgetNotFoundError(k)
-                k = loader.built_data[k]
-            self._print_build(f"Building hook for '{k}'...")
-            self._hooks[origin_k] = build_hook(k, self._get_widget(widgets, k))
-            self._hooked_widgets[self._name].append(k)
-            self._print_build(f"Successfully hooked '{k}'! {self._hooks[origin_k]}")
+                # check if k matches or if k is in the dynamic loader
+                # if k is in neither of them then we are missing a widget
+                origin_k = k
+                widget = widget_map.get(k)
+                if widget is None:
+                    widget = loader.widget_for(k)
+                    k = loader.built_data[k]
+                self._print_build(f"Building hook for '{k}'...")
+                self._hooks[origin_k] = build_hook(k, widget)
+                self._mark_hooked(k, self._hooks[origin_k])
+                self._print_build(
+                    f"Successfully hooked '{k}'! {self._hooks[origin_k]}"
+                )
 
     @staticmethod
-    def _get_widget(widgets: list[QWidget], key: str) -> QWidget:
-        """Finds a key matching a widgets objectName in a list of widgets.
-
-        Parameters
-        ----------
-        widgets :class:`list[QWidget]`:
-            A list of possible widgets
-
-        key :class:`str`:
-            The key to find the widget of
-
-        Returns
-        -------
-        `QWidget`:
-            The widget matching the key
-
-        Raises
-        ------
-        `WidgetNotFoundError`
-            When the widget wasnt found
-        """
-        for w in widgets:
-            if w.objectName() == key:
-                return w
-        raise WidgetNotFoundError(key)
+    def _map_widgets(widgets: list[QWidget] | dict[str, QWidget]) -> dict[str, QWidget]:
+        """Maps the widgets by their object name, unless they already are. Each
+        widgets name is queried exactly once, no matter how deep the data is."""
+        if isinstance(widgets, dict):
+            return widgets
+        return {w.objectName(): w for w in widgets}
 
     def _print_build(self, message: str) -> None:
         """Print wrapper to print only when the `show_build` flag is `True`.
@@ -1,10 +1,12 @@
+from weakref import WeakKeyDictionary
+
 from PySide6.QtWidgets import (QCheckBox, QComboBox, QDateEdit, QDoubleSpinBox,
                                QFontComboBox, QLineEdit, QMainWindow,
                                QPlainTextEdit, QProgressBar, QPushButton,
                                QSlider, QSpinBox, QStackedWidget, QTabWidget,
                                QTextBrowser, QTextEdit, QWidget)
 
-_SUPPORTED_WIDGETS = [
+_SUPPORTED_WIDGETS = (
     QComboBox,
     QFontComboBox,
     QCheckBox,
@@ -18,23 +20,71 @@ _SUPPORTED_WIDGETS = [
     QLineEdit,
     QTabWidget,
     QStackedWidget,
-    QDateEdit
-]
+    QDateEdit,
+)
+_SUPPORTED_TYPES = frozenset(_SUPPORTED_WIDGETS)
+
+# the widgets found in the parents marked as frozen, dropped together with the parent
+_frozen_widgets: WeakKeyDictionary[QWidget, tuple[QWidget, ...]] = WeakKeyDictionary()
+
 
-def get_all_widgets(parent: QMainWindow) -> list[QWidget]:
+def get_all_widgets(parent: QMainWindow, frozen: bool = False) -> list[QWidget]:
     """Gets all children widgets of a parent.
     
     Parameters
     ----------
     parent :class:`QMainWindow`:
         The widget to get the children of
+
+    frozen :class:`bool`:
+        Whether the children of the parent no longer change, e.g. after `setupUi`.
+        The children of a frozen parent are only searched the first time, later
+        frozen calls return the widgets found then. A call that is not frozen
+        always searches again and updates the widgets of a frozen parent.
         
     Returns
     -------
     `list[QWidget]`:
         A list of supported children of the parent
     """
-    ret = []
-    for widget in _SUPPORTED_WIDGETS:
-        ret += parent.findChildren(widget)
-    return ret
+    if frozen:
+        widgets = _frozen_widgets.get(parent)
+        if widgets is not None:
+            return list(widgets)
+
+    # a single walk of the children, filtering for the supported widgets also
+    # keeps subclasses like the QFontComboBox from being found twice. The
+    # exact type is checked first, only other widgets go through isinstance
+    found = [
+        w
+        for w in parent.findChildren(QWidget)
+        if type(w) in _SUPPORTED_TYPES or isinstance(w, _SUPPORTED_WIDGETS)
+    ]
+    if frozen or parent in _frozen_widgets:
+        _frozen_widgets[parent] = tuple(found)
+    return found
+
+
+def get_all_widgets_map(
+    parent: QMainWindow, frozen: bool = False
+) -> dict[str, QWidget]:
+    """Gets all children widgets of a parent mapped by their object name, which
+    can be passed to a `QConfig` in place of the list of widgets.
+
+    The names are queried on every call, since they may change while the
+    widgets stay the same.
+
+    Parameters
+    ----------
+    parent :class:`QMainWindow`:
+        The widget to get the children of
+
+    frozen :class:`bool`:
+        Whether the children of the parent no longer change, see `get_all_widgets`
+
+    Returns
+    -------
+    `dict[str, QWidget]`:
+        The supported children of the parent mapped by their object name
+    """
+    return {w.objectName(): w for w in get_all_widgets(parent, frozen)}
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from unittest import mock
+
+from qconfig import _file_tools
+from qconfig._file_tools import READERS, WRITERS, read_file, write_file
+from qconfig._xml_tools import etree_to_dict, iterparse_to_dict
+
+
+class TestFileTools(unittest.TestCase):
+    data = {
+        "user_name": "Kenny",
+        "employed": False,
+        "kids": 0,
+        "school_average": 2.3,
+        "personal": {"nationality": "German", "languages": ["German", "English"]},
+    }
+
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def _path(self, extension: str) -> str:
+        return os.path.join(self.dir.name, "config" + extension)
+
+    def _check_round_trip(self, extension: str) -> None:
+        path = self._path(extension)
+        WRITERS[extension](path, self.data)
+        assert READERS[extension](path) == self.data
+
+    @unittest.skipIf(_file_tools.orjson is None, "orjson is not installed")
+    def test_json_round_trip_orjson(self) -> None:
+        """Asserts that data written to json with orjson is read back unchanged"""
+        self._check_round_trip(".json")
+
+    def test_json_round_trip(self) -> None:
+        """Asserts that data written to json without orjson is read back unchanged"""
+        with mock.patch.object(_file_tools, "orjson", None):
+            self._check_round_trip(".json")
+
+    @unittest.skipIf(_file_tools.orjson is None, "orjson is not installed")
+    def test_json_backends_match(self) -> None:
+        """Asserts that both json backends write the exact same file"""
+        data = dict(self.data, nationality="Österreich", children={}, pets=[])
+        path = self._path(".json")
+
+        WRITERS[".json"](path, data)
+        with open(path, "rb") as f:
+            written = f.read()
+        with mock.patch.object(_file_tools, "orjson", None):
+            WRITERS[".json"](path, data)
+        with open(path, "rb") as f:
+            assert f.read() == written
+
+    def test_yaml_round_trip(self) -> None:
+        """Asserts that data written to yaml is read back unchanged"""
+        self._check_round_trip(".yaml")
+
+    def test_xml_round_trip(self) -> None:
+        """Asserts that nested data written to xml is read back unchanged"""
+        data = {
+            "config": {
+                "user_name": "Kenny",
+                "personal": {"kids": "0", "married": "False"},
+                "school": {"grades": {"math": "1", "art": "3"}},
+            }
+        }
+        path = self._path(".xml")
+        WRITERS[".xml"](path, data)
+
+        assert READERS[".xml"](path) == data
+        assert iterparse_to_dict(path) == etree_to_dict(ET.parse(path).getroot())
+
+    def test_write_keeps_file(self) -> None:
+        """Asserts that writing keeps the mode and symlink of the existing file"""
+        path = self._path(".json")
+        WRITERS[".json"](path, {})
+        os.chmod(path, 0o640)
+        link = self._path("_link.json")
+        os.symlink(path, link)
+
+        write_file(link, ".json", self.data)
+
+        assert os.path.islink(link)
+        assert os.stat(path).st_mode & 0o777 == 0o640
+        assert read_file(path, ".json") == self.data
+        assert sorted(os.listdir(self.dir.name)) == ["config.json", "config_link.json"]
@@ -1,6 +1,7 @@
 import unittest
 
 from qconfig import QConfigDynamicLoader
+from qconfig.exceptions import WidgetNotFoundError
 from qconfig.tools import get_all_widgets
 
 from .sampel_ui import SampleUi
@@ -78,5 +79,26 @@ class TestQDynamicLoaderTest(unittest.TestCase):
 
         assert result == expected
 
+    def test_widget_for(self) -> None:
+        """Asserts that the widget a key was mapped to can be retrieved"""
+        loader = QConfigDynamicLoader({"name": "user_name"})
+        loader.build(self.widgets)
+
+        assert loader.widget_for("name") is self.ui.user_name
+
+        with self.assertRaises(WidgetNotFoundError):
+            loader.widget_for("xxxxx")
+
+    def test_build_from_widget_map(self) -> None:
+        """Asserts that the loader can be built from widgets mapped by name"""
+        loader = QConfigDynamicLoader(["name", "reason"], complement_keys=True)
+        loader.build({w.objectName(): w for w in self.widgets})
+
+        assert loader.built_data == {
+            "name": "user_name",
+            "reason": "reason_of_application",
+        }
+        assert loader.widget_for("reason") is self.ui.reason_of_application
+
 if __name__ == "__main__":
     unittest.main()
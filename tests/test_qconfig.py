@@ -1,10 +1,14 @@
 import json
+import os
 from time import sleep
 import unittest  # type:ignore[import]
 
+import shiboken6
+from PySide6.QtCore import QDate
+from PySide6.QtWidgets import QSpinBox
 from qconfig import QConfig, QConfigDynamicLoader
 from qconfig.exceptions import WidgetAlreadydHookedError
-from qconfig.tools import get_all_widgets
+from qconfig.tools import get_all_widgets, get_all_widgets_map
 
 from .sampel_ui import SampleUi
 
@@ -97,6 +101,67 @@ class TestQConfig(unittest.TestCase):
         self.ui.date_of_birth.setObjectName("born_in")
         self.ui.disabled.setObjectName("has_disability")
 
+    def test_build_from_widget_map(self) -> None:
+        qconfig = QConfig("test widget map", get_all_widgets_map(self.ui), self.data)
+        qconfig.set_data()
+
+        assert self.ui.user_name.text() == self.data["user_name"]
+        assert self.ui.kids.value() == self.data["kids"]
+
+    def test_widgets_found_again(self) -> None:
+        """Asserts that widgets added to the parent later are found as well"""
+        spinbox = QSpinBox(self.ui)
+        spinbox.setObjectName("added_later")
+
+        assert spinbox in get_all_widgets(self.ui)
+        assert "added_later" in get_all_widgets_map(self.ui)
+
+    def test_frozen_widgets(self) -> None:
+        """Asserts that a frozen parent is only searched until it is searched
+        without being frozen again"""
+        widgets = get_all_widgets(self.ui, frozen=True)
+        spinbox = QSpinBox(self.ui)
+
+        assert get_all_widgets(self.ui, frozen=True) == widgets
+        assert spinbox in get_all_widgets(self.ui)
+        assert spinbox in get_all_widgets(self.ui, frozen=True)
+
+    def test_nested_data(self) -> None:
+        data = {"personal": {"user_name": "Kenny", "kids": 0}, "happiness": 10}
+        qconfig = QConfig("nested data", self.widgets, data)
+        qconfig.set_data()
+
+        assert self.ui.user_name.text() == "Kenny"
+        assert self.ui.kids.value() == 0
+        assert self.ui.happiness.value() == 10
+
+        self.ui.kids.setValue(2)
+        qconfig.get_data()
+
+        assert data["personal"]["kids"] == 2
+        assert qconfig.values_match()
+
+        self.ui.kids.setValue(3)
+
+        assert not qconfig.values_match()
+
+    def test_nested_data_replaced(self) -> None:
+        data = {"personal": {"user_name": "Kenny", "kids": 0}, "happiness": 10}
+        qconfig = QConfig("nested replaced", self.widgets, data)
+        qconfig.set_data()
+
+        qconfig.data["personal"] = {"user_name": "Obama", "kids": 2}
+        qconfig.set_data()
+
+        assert self.ui.user_name.text() == "Obama"
+        assert self.ui.kids.value() == 2
+
+        self.ui.kids.setValue(3)
+        qconfig.get_data()
+
+        assert qconfig.data["personal"]["kids"] == 3
+        assert qconfig.values_match()
+
     def test_load_from_file(self) -> None:
         qconfig = QConfig("test from file", self.widgets, filepath="tests/sample_data.json")
 
@@ -106,6 +171,14 @@ class TestQConfig(unittest.TestCase):
 
         assert qconfig.data == self.data
 
+    def test_read_returns_copy(self) -> None:
+        qconfig = QConfig("test read copy", self.widgets, filepath="tests/sample_data.json")
+        qconfig.data["user_name"] = "Jeffrey"
+
+        qconfig.read()
+
+        assert qconfig.data == self.data
+
     def test_values_match(self) -> None:
         qconfig = QConfig("test values matching", self.widgets, self.data)
         qconfig.set_data()
@@ -150,6 +223,24 @@ class TestQConfig(unittest.TestCase):
             "multihooking 3", self.widgets, self.data, allow_multiple_hooks=True
         )
 
+    def test_multihooking_same_name(self) -> None:
+        c1 = QConfig("multihooking same", self.widgets, self.data)
+        c2 = QConfig(
+            "multihooking same", self.widgets, self.data, allow_multiple_hooks=True
+        )
+        c2.destroy()
+
+        with self.assertRaises(WidgetAlreadydHookedError):
+            c3 = QConfig("multihooking other", self.widgets, self.data)
+
+    def test_destroy_after_widgets_deleted(self) -> None:
+        """Asserts that a config can be destroyed after its widgets were deleted"""
+        c = QConfig("widgets deleted", self.widgets, self.data)
+        c.connect_callback(lambda: None)
+        shiboken6.delete(self.ui)
+
+        c.destroy()
+
     def test_save_on_change(self) -> None:
         c1 = QConfig("save on change", self.widgets, filepath="tests/sample_data.json")
 
@@ -159,8 +250,19 @@ class TestQConfig(unittest.TestCase):
 
         assert c1.data["drivers_license"]
 
+        c1.save_on_change = False
+
         self.ui.drivers_license.setChecked(False)
 
+        assert c1.data["drivers_license"]
+
+        c1.save_on_change = True
+
+        self.ui.drivers_license.setChecked(True)
+        self.ui.drivers_license.setChecked(False)
+
+        assert not c1.data["drivers_license"]
+
     def test_dump_on_save(self) -> None:
         c1 = QConfig("dump on save", self.widgets, filepath="tests/sample_data.json")
 
@@ -178,6 +280,78 @@ class TestQConfig(unittest.TestCase):
         with open("tests/sample_data.json", "w") as f:
             json.dump(self.data, f, indent=4)
 
+    def test_dump_delay(self) -> None:
+        c1 = QConfig(
+            "dump delay",
+            self.widgets,
+            filepath="tests/sample_data.json",
+            save_on_change=True,
+            dump_on_save=True,
+            dump_delay=1000,
+        )
+
+        self.ui.drivers_license.setChecked(True)
+
+        with open("tests/sample_data.json", "r") as f:
+            assert not json.load(f)["drivers_license"]
+
+        c1.flush()
+
+        with open("tests/sample_data.json", "r") as f:
+            data = json.load(f)
+
+        assert data["drivers_license"]
+
+        with open("tests/sample_data.json", "w") as f:
+            json.dump(self.data, f, indent=4)
+
+    def test_destroy_flushes_dump(self) -> None:
+        c1 = QConfig(
+            "destroy flush",
+            self.widgets,
+            filepath="tests/sample_data.json",
+            save_on_change=True,
+            dump_on_save=True,
+            dump_delay=1000,
+        )
+
+        self.ui.drivers_license.setChecked(True)
+        c1.destroy()
+        self.ui.married.setChecked(True)
+
+        with open("tests/sample_data.json", "r") as f:
+            data = json.load(f)
+
+        assert data["drivers_license"] and not data["married"]
+
+        with open("tests/sample_data.json", "w") as f:
+            json.dump(self.data, f, indent=4)
+
+    def test_dump_skips_unchanged_data(self) -> None:
+        c1 = QConfig(
+            "dump unchanged",
+            self.widgets,
+            filepath="tests/sample_data.json",
+            suppress=["date_of_birth"],
+            dump_on_save=True,
+        )
+        c1.set_data()
+        modified = os.stat("tests/sample_data.json").st_mtime_ns
+
+        c1.get_data()
+
+        assert os.stat("tests/sample_data.json").st_mtime_ns == modified
+
+    def test_invalid_dates_ignored(self) -> None:
+        """Asserts that dates not matching `dd.MM.yyyy` leave the widget unchanged"""
+        c = QConfig("invalid dates", self.widgets, {"date_of_birth": "03.01.2004"})
+        c.set_data()
+
+        for date in ("01.01.04", " 1.01.2004", "01-01-2004", "01.01.+004"):
+            c.data["date_of_birth"] = date
+            c.set_data()
+            assert self.ui.date_of_birth.date() == QDate(2004, 1, 3)
+
     def test_invalid_actions(self) -> None:
         with self.assertRaises(ValueError):
             QConfig("no data or file", self.widgets)